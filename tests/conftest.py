@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app modules live in ui/ and import each other by bare name, as Streamlit runs them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
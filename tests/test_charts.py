@@ -0,0 +1,43 @@
+import base64
+
+import numpy as np
+import pandas as pd
+
+import charts
+
+
+def frame(rows):
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2009-01-03", periods=rows, freq="D"),
+        "market-price": np.linspace(1.0, 2.0, rows),
+    })
+
+
+def decode(spec):
+    assert spec["dtype"] == "f8"
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<f8")
+
+
+def test_typed_array_round_trips_float64():
+    values = [0.1, 12345.678, -3.0]
+
+    assert decode(charts.typed_array(values)).tolist() == values
+
+
+def test_timestamps_are_sent_as_epoch_ms_on_a_date_axis():
+    fig = charts.line_chart(frame(2), x="timestamp", y="market-price")
+
+    assert decode(fig.data[0].x).tolist() == [1230940800000.0, 1230940800000.0 + 86400000]
+    assert fig.layout.xaxis.type == "date"
+
+
+def test_long_series_switch_to_webgl():
+    assert charts.line_chart(frame(10), x="timestamp", y="market-price", webgl_threshold=10).data[0].type == "scattergl"
+    assert charts.line_chart(frame(9), x="timestamp", y="market-price", webgl_threshold=10).data[0].type == "scatter"
+
+
+def test_range_slider_keeps_svg_traces():
+    fig = charts.line_chart(frame(10), x="timestamp", y="market-price", rangeslider=True, webgl_threshold=10)
+
+    assert fig.data[0].type == "scatter"
+    assert fig.layout.xaxis.rangeslider.visible
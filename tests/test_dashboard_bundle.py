@@ -0,0 +1,57 @@
+import json
+
+import plotly.graph_objects as go
+import pytest
+
+import dashboard_bundle
+import shared_cache
+
+
+@pytest.fixture(autouse=True)
+def bundle_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(dashboard_bundle, "BUNDLE_DIR", str(tmp_path / "bundle"))
+    return tmp_path / "bundle"
+
+
+def export():
+    dashboard_bundle.write({"rmse": go.Figure(go.Bar(x=["LR"], y=[1.0]))}, {"Base Features": ["a"]}, "hash")
+
+
+def test_missing_bundle_is_not_available():
+    assert not dashboard_bundle.available()
+
+
+def test_fresh_bundle_is_served():
+    export()
+
+    assert dashboard_bundle.available()
+    assert list(dashboard_bundle.load_figures(["rmse", "loss"])) == ["rmse"]
+    assert dashboard_bundle.load_features() == {"Base Features": ["a"]}
+
+
+def test_bump_generation_makes_bundle_stale():
+    export()
+    shared_cache.bump_generation()
+
+    assert not dashboard_bundle.available()
+
+
+def test_old_bundle_is_stale(bundle_dir):
+    export()
+    manifest_path = bundle_dir / dashboard_bundle.MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text())
+    manifest["generated_at"] = "2000-01-01T00:00:00+00:00"
+    manifest_path.write_text(json.dumps(manifest))
+
+    assert not dashboard_bundle.available()
+
+
+def test_write_manifest_restamps_stale_bundle():
+    export()
+    shared_cache.bump_generation()
+    manifest = dashboard_bundle.load_manifest()
+
+    dashboard_bundle.write_manifest(manifest["figures"], manifest["source_hash"])
+
+    assert dashboard_bundle.available()
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import multiprocessing
+
+import pandas as pd
+import pytest
+
+import shared_cache
+
+PROCESSES = 8
+
+# Fork so the workers inherit the CACHE_DIR the fixture points at the test's tmp_path
+fork = multiprocessing.get_context("fork")
+
+
+class FileDatabase:
+    """Stand-in Mongo client over one JSON file, shared by every process.
+
+    Each find() appends a line to a fetch log so tests can count real fetches.
+    """
+
+    def __init__(self, root):
+        self.docs_path = os.path.join(root, "docs.json")
+        self.log_path = os.path.join(root, "fetches.log")
+
+    def seed(self, docs):
+        with open(self.docs_path, "w") as docs_file:
+            json.dump(docs, docs_file)
+
+    def fetches(self) -> int:
+        if not os.path.exists(self.log_path):
+            return 0
+        with open(self.log_path) as log_file:
+            return len(log_file.readlines())
+
+    # client[db_name][collection_name].find({})
+    def __getitem__(self, name):
+        return self
+
+    def find(self, query):
+        with open(self.log_path, "a") as log_file:
+            log_file.write(f"{os.getpid()}\n")
+        # A slow fetch widens the window in which a missing lock would let others in
+        time.sleep(0.2)
+        with open(self.docs_path) as docs_file:
+            return json.load(docs_file)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(shared_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = FileDatabase(str(tmp_path))
+    database.seed([{"timestamp": f"2020-01-{day:02d}", "market-price": 100.0 + day} for day in range(1, 29)])
+    return database
+
+
+def _fetch(database, start_barrier, results):
+    start_barrier.wait()
+    df = shared_cache.cached_collection(database, "bitcoinprice", "Dataset_Raw")
+    results.put(df["market-price"].tolist())
+
+
+# Start every worker together and collect what each one read
+def run_workers(database):
+    start_barrier = fork.Barrier(PROCESSES)
+    results = fork.Queue()
+    workers = [fork.Process(target=_fetch, args=(database, start_barrier, results)) for _ in range(PROCESSES)]
+    for worker in workers:
+        worker.start()
+    seen = [results.get(timeout=60) for _ in workers]
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+    return seen
+
+
+def test_loader_runs_once_per_key_across_processes(database):
+    seen = run_workers(database)
+
+    assert database.fetches() == 1
+    assert all(prices == seen[0] for prices in seen)
+    assert len(seen[0]) == 28
+
+
+def test_bump_generation_invalidates_every_process(database):
+    run_workers(database)
+    database.seed([{"timestamp": "2020-02-01", "market-price": 42.0}])
+
+    # Without a bump every process keeps serving the cached frame
+    assert run_workers(database) == [[100.0 + day for day in range(1, 29)]] * PROCESSES
+    assert database.fetches() == 1
+
+    shared_cache.bump_generation()
+    assert run_workers(database) == [[42.0]] * PROCESSES
+    assert database.fetches() == 2
+
+
+def test_evict_trims_to_max_bytes_in_lru_order(cache_dir):
+    for key in ["oldest", "middle", "newest"]:
+        shared_cache.cached_frame(key, lambda: pd.DataFrame({"value": range(10000)}))
+    entries = {
+        key: os.path.join(cache_dir, f"0-{shared_cache._key_digest(key)}{shared_cache.ENTRY_SUFFIX}")
+        for key in ["oldest", "middle", "newest"]
+    }
+    # Last use is tracked through atime; pin it so the order doesn't depend on timing
+    for last_used, key in enumerate(["oldest", "middle", "newest"]):
+        os.utime(entries[key], (1_000_000 + last_used, os.stat(entries[key]).st_mtime))
+    entry_size = os.path.getsize(entries["newest"])
+
+    shared_cache.evict(max_bytes=2 * entry_size)
+
+    assert not os.path.exists(entries["oldest"])
+    assert os.path.exists(entries["middle"])
+    assert os.path.exists(entries["newest"])
+    total = sum(os.path.getsize(path) for path in entries.values() if os.path.exists(path))
+    assert total <= 2 * entry_size
+
+
+def test_evict_drops_previous_generations(cache_dir):
+    shared_cache.cached_frame("key", lambda: pd.DataFrame({"value": [1]}))
+    shared_cache.bump_generation()
+
+    assert not any(name.startswith("0-") for name in os.listdir(cache_dir))
+
+
+def test_mixed_type_columns_are_cached(database):
+    database.seed([{"a": 1, "b": 1.5}, {"a": "two", "b": 2.5}, {"a": None, "b": 3.5}])
+
+    for _ in range(2):
+        df = shared_cache.cached_collection(database, "bitcoinprice", "mixed")
+        assert df["a"].tolist() == [1, "two", None]
+        assert df["b"].tolist() == [1.5, 2.5, 3.5]
+
+    assert database.fetches() == 1
+
+
+def test_without_flock_frames_come_straight_from_the_loader(database, monkeypatch):
+    monkeypatch.setattr(shared_cache, "fcntl", None)
+
+    for _ in range(2):
+        assert len(shared_cache.cached_collection(database, "bitcoinprice", "Dataset_Raw")) == 28
+
+    assert database.fetches() == 2
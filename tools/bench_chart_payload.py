@@ -0,0 +1,73 @@
+"""Benchmark the market-price chart payload: px.line vs ui/charts.line_chart.
+
+Builds the 1_Dataset.py line chart both ways for several series lengths and
+reports the JSON payload size st.plotly_chart sends and the time to build and
+serialize the figure.
+
+Usage (from the repository root):
+    python tools/bench_chart_payload.py --sizes 1000 5000 50000
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+import charts  # noqa: E402
+
+LABELS = {'timestamp': 'Timestamp', 'market-price': 'Market Price'}
+TITLE = 'Market Price of Bitcoin Over Time'
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(5003)
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2009-01-03", periods=rows, freq="D"),
+        "market-price": 4000 * np.exp(np.cumsum(rng.normal(0, 0.03, rows))),
+    })
+
+
+def current_path(df):
+    fig = px.line(df, x='timestamp', y='market-price', labels=LABELS, title=TITLE)
+    fig.update_xaxes(rangeslider_visible=True)
+    return fig
+
+
+def typed_array_path(df):
+    return charts.line_chart(df, x='timestamp', y='market-price', labels=LABELS, title=TITLE, rangeslider=True)
+
+
+# Best-of-repeats time to build and serialize, the way st.plotly_chart does
+def measure(build, df, repeats: int):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        payload = pio.to_json(build(df), validate=False)
+        timings.append(time.perf_counter() - started)
+    return len(payload.encode("utf-8")), min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 50000, 500000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'px.line KB':>13}{'typed KB':>11}{'ratio':>8}{'px.line ms':>13}{'typed ms':>11}  trace")
+    for rows in args.sizes:
+        df = make_frame(rows)
+        current_bytes, current_time = measure(current_path, df, args.repeats)
+        typed_bytes, typed_time = measure(typed_array_path, df, args.repeats)
+        trace_type = typed_array_path(df).data[0].type
+        print(f"{rows:>8}{current_bytes / 1024:>13.1f}{typed_bytes / 1024:>11.1f}"
+              f"{current_bytes / typed_bytes:>8.1f}{current_time * 1000:>13.1f}"
+              f"{typed_time * 1000:>11.1f}  {trace_type}")
+
+
+if __name__ == "__main__":
+    main()
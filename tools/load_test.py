@@ -0,0 +1,318 @@
+"""Concurrent-session load test for the Streamlit app.
+
+Drives N simulated sessions at once through the app with Streamlit's headless
+AppTest API, inside this one process and against a seeded Mongo stand-in. Each
+session lands on ui/Home.py, opens every page from the sidebar (picking a few
+months on the Dataset page), then goes back to some pages at random, pausing
+for a random think time between actions. Exits non-zero when a budget is
+exceeded or a page raises.
+
+AppTest swaps process-global state (st.secrets, the Runtime instance) on every
+run, so script runs from different sessions can't overlap and are queued on one
+lock. A real Streamlit process runs each session's script in its own thread and
+releases the GIL during Mongo, pandas and Arrow work, so the two numbers are
+reported separately:
+
+    service  time one rerun's script takes; the p50/p95 budgets apply to it
+    queued   time spent waiting for the lock; with every rerun fully
+             serialized this is an upper bound on real queueing, for
+             information only
+
+Memory per session is the peak RSS growth of this process while all sessions
+are live, divided by the number of sessions.
+
+The shared cache and the dashboard bundle both point at fresh temporary
+directories, so by default pages 2, 4 and 5 read from the stand-in. Pass
+--bundle to export a bundle from the stand-in first and measure the pages
+serving from it instead.
+
+By default the stand-in is an in-process mongomock database (see
+requirements-dev.txt). Pass --mongo-uri to seed and use a throwaway local
+mongod instead.
+
+Usage (from the repository root):
+    python tools/load_test.py --sessions 20 --p95-budget-ms 1500
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pymongo
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+UI_DIR = os.path.join(ROOT_DIR, "ui")
+PAGES_DIR = os.path.join(UI_DIR, "pages")
+
+DB_NAME = "bitcoinprice"
+MODELS = [
+    "GeneralizedLinearRegression",
+    "GradientBoostingTreeRegressor",
+    "LinearRegression",
+    "RandomForestRegressor",
+]
+SPLITTINGS = ["Normal", "TimeSeries"]
+
+
+# Seed the stand-in with collections shaped like the real ones
+def seed_database(client, days: int):
+    db = client[DB_NAME]
+    rng = np.random.default_rng(5003)
+    start = datetime(2019, 1, 1)
+
+    prices = 4000 * np.exp(np.cumsum(rng.normal(0, 0.03, days)))
+    db["Dataset_Raw"].drop()
+    db["Dataset_Raw"].insert_many([
+        {
+            "timestamp": (start + timedelta(days=i)).strftime("%Y-%m-%d"),
+            "opening-price": float(price * 0.99),
+            "highest-price": float(price * 1.02),
+            "lowest-price": float(price * 0.97),
+            "closing-price": float(price),
+            "market-price": float(price),
+            "trade-volume-btc": float(rng.uniform(1e3, 1e5)),
+            "trade-volume-usd": float(rng.uniform(1e7, 1e9)),
+            "market-cap": float(price * 1.8e7),
+            "total-bitcoins": float(1.8e7 + i * 900),
+            "n-transactions": int(rng.integers(2e5, 4e5)),
+        }
+        for i, price in enumerate(prices)
+    ])
+
+    db["all"].drop()
+    db["all"].insert_many([
+        {"Model": model, "Type": kind, "Splitting": split,
+         "RMSE": float(rng.uniform(100, 900)), "R2": float(rng.uniform(0.6, 1.0))}
+        for model in MODELS for kind in ["Default", "Tuned"] for split in SPLITTINGS
+    ])
+
+    db["accuracy"].drop()
+    db["accuracy"].insert_many([
+        {"Model": model, "Splitting": split,
+         "Accuracy (default)": float(rng.uniform(50, 90)),
+         "Accuracy (tuned)": float(rng.uniform(50, 95))}
+        for model in MODELS for split in SPLITTINGS
+    ])
+
+    db["final"].drop()
+    db["final"].insert_many([
+        {"Model": model, "Dataset": dataset, "Features": features,
+         "Accuracy": float(rng.uniform(50, 95)), "RMSE": float(rng.uniform(100, 900)),
+         "MSE": float(rng.uniform(1e4, 8e5)), "MAE": float(rng.uniform(50, 700)),
+         "MAPE": float(rng.uniform(0.01, 0.2))}
+        for model in MODELS
+        for dataset in ["Normal", "TimeSeries"]
+        for features in ["Base", "Base + Most Corr", "Base + Least Corr"]
+    ])
+
+
+# Point every pymongo.MongoClient the pages create at one shared mongomock client
+def install_mongomock():
+    import mongomock
+
+    shared_client = mongomock.MongoClient()
+    pymongo.MongoClient = lambda *args, **kwargs: shared_client
+    return shared_client
+
+
+HOME = "Home.py"
+
+
+# Interactions a user performs after opening a page; each yields one rerun
+def no_interactions(at, rng):
+    return iter(())
+
+
+def dataset_interactions(at, rng):
+    options = list(at.selectbox[0].options)
+    for option in rng.sample(options, min(3, len(options))):
+        yield lambda option=option: at.selectbox[0].select(option).run()
+
+
+# Paths are relative to ui/, as st.switch_page expects
+PAGES = {
+    HOME: no_interactions,
+    "pages/1_Dataset.py": dataset_interactions,
+    "pages/2_Feature_Selection.py": no_interactions,
+    "pages/4_Model Training & Hyp Tuning.py": no_interactions,
+    "pages/5_Final Result on Testing Data.py": no_interactions,
+}
+
+
+# Land on Home, open every page from the sidebar, then go back to a few at random
+def session_script(at, rng, revisits):
+    tour = [page for page in PAGES if page != HOME] + rng.choices(list(PAGES), k=revisits)
+    yield HOME, at.run
+    for page in tour:
+        yield page, lambda page=page: at.switch_page(page).run()
+        for action in PAGES[page](at, rng):
+            yield page, action
+
+
+def rss_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+# Sample RSS in the background so the peak while sessions overlap is captured
+class PeakRss(threading.Thread):
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = rss_bytes()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, rss_bytes())
+
+    def stop(self) -> int:
+        self.stopped.set()
+        self.join()
+        return max(self.peak, rss_bytes())
+
+
+# Only one AppTest run may touch the process-global Streamlit state at a time
+RUNTIME_LOCK = threading.Lock()
+
+
+# Run one session's script, timing each rerun's service and queued time.
+# Returns the AppTest so the session's state stays alive like a real one.
+def walk_session(session_id, args, rng, think_time_ms, reruns, errors):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(UI_DIR, HOME), default_timeout=args.timeout)
+    at.secrets["mongo"] = {"connection_string": args.mongo_uri or "mongodb://stand-in"}
+    for page, action in session_script(at, rng, args.revisits):
+        time.sleep(rng.uniform(0, 2 * think_time_ms) / 1000)
+        requested = time.perf_counter()
+        with RUNTIME_LOCK:
+            started = time.perf_counter()
+            action()
+        finished = time.perf_counter()
+        reruns.append((os.path.basename(page), finished - started, started - requested))
+        if at.exception:
+            errors.append((session_id, os.path.basename(page), at.exception[0].message))
+            break
+    return at
+
+
+# One simulated session: wait for the others, then run the session script
+def run_session(session_id, args, start_barrier, reruns, errors):
+    start_barrier.wait()
+    try:
+        return walk_session(session_id, args, random.Random(session_id), args.think_time_ms, reruns, errors)
+    except Exception as e:
+        errors.append((session_id, None, repr(e)))
+
+
+def print_row(label, rows):
+    service_p50, service_p95 = np.percentile([service for _, service, _ in rows], [50, 95]) * 1000
+    queued_p50, queued_p95 = np.percentile([queued for _, _, queued in rows], [50, 95]) * 1000
+    print(f"{label:<40}{len(rows):>8}{service_p50:>13.1f}{service_p95:>13.1f}"
+          f"{queued_p50:>13.1f}{queued_p95:>13.1f}")
+    return service_p50, service_p95
+
+
+def report(reruns, sessions, memory_per_session):
+    print(f"{'page':<40}{'reruns':>8}{'service p50':>13}{'service p95':>13}{'queued p50':>13}{'queued p95':>13}")
+    for page in PAGES:
+        label = os.path.basename(page)
+        rows = [row for row in reruns if row[0] == label]
+        if rows:
+            print_row(label, rows)
+    p50, p95 = print_row("all pages", reruns) if reruns else (None, None)
+    print("(ms; queued is the wait for the serialized AppTest runtime, an upper bound shown for information)")
+    print(f"sessions: {sessions}, memory per session: {memory_per_session / 2 ** 20:.1f} MB")
+    return p50, p95
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent simulated sessions")
+    parser.add_argument("--revisits", type=int, default=3, help="random page revisits after the first tour")
+    parser.add_argument("--think-time-ms", type=float, default=500, help="mean pause between user actions")
+    parser.add_argument("--days", type=int, default=1500, help="rows seeded into Dataset_Raw")
+    parser.add_argument("--timeout", type=float, default=60, help="per-rerun timeout in seconds")
+    parser.add_argument("--mongo-uri", help="throwaway local mongod to seed instead of mongomock")
+    parser.add_argument("--bundle", action="store_true", help="export a dashboard bundle and measure pages serving it")
+    parser.add_argument("--p50-budget-ms", type=float, default=500, help="p50 rerun service time")
+    parser.add_argument("--p95-budget-ms", type=float, default=2000, help="p95 rerun service time")
+    parser.add_argument("--memory-budget-mb", type=float, default=50, help="peak RSS growth per live session")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # Pages read ./features and ui/image relative to the repository root
+    os.chdir(ROOT_DIR)
+    sys.path.insert(0, UI_DIR)
+    os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "error")
+
+    # Keep the shared cache and any real ./dashboard_bundle out of the measurement
+    work_dir = tempfile.mkdtemp(prefix="msbd5003_load_test_")
+    os.environ["MSBD_CACHE_DIR"] = os.path.join(work_dir, "cache")
+    os.environ["MSBD_DASHBOARD_BUNDLE"] = os.path.join(work_dir, "bundle")
+    import dashboard_bundle
+
+    if args.mongo_uri:
+        client = pymongo.MongoClient(args.mongo_uri)
+    else:
+        client = install_mongomock()
+    seed_database(client, args.days)
+    if args.bundle:
+        print(dashboard_bundle.export(client[DB_NAME]))
+    print("pages 2, 4 and 5 serve from: "
+          + ("the exported bundle" if dashboard_bundle.available() else "live reads of the stand-in"))
+
+    # Warm-up session so imports and the shared cache aren't billed to the sessions
+    reruns, errors = [], []
+    try:
+        walk_session(-1, args, random.Random(-1), 0, [], errors)
+    except Exception as e:
+        errors.append((-1, None, repr(e)))
+
+    start_barrier = threading.Barrier(args.sessions)
+    baseline_rss = rss_bytes()
+    peak_rss = PeakRss()
+    peak_rss.start()
+    with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+        futures = [
+            executor.submit(run_session, session_id, args, start_barrier, reruns, errors)
+            for session_id in range(args.sessions)
+        ]
+        # Keep every session's state alive until all of them are done
+        sessions = [future.result() for future in futures]
+    memory_per_session = max(peak_rss.stop() - baseline_rss, 0) / args.sessions
+    del sessions
+
+    p50, p95 = report(reruns, args.sessions, memory_per_session)
+
+    failures = [
+        f"{'warm-up' if session < 0 else f'session {session}'} on {page or 'start-up'}: {message}"
+        for session, page, message in errors
+    ]
+    if p50 is None:
+        failures.append("no rerun completed")
+    elif p50 > args.p50_budget_ms:
+        failures.append(f"p50 rerun service time {p50:.1f} ms exceeds budget {args.p50_budget_ms} ms")
+    if p95 is not None and p95 > args.p95_budget_ms:
+        failures.append(f"p95 rerun service time {p95:.1f} ms exceeds budget {args.p95_budget_ms} ms")
+    if memory_per_session / 2 ** 20 > args.memory_budget_mb:
+        failures.append(f"memory per session {memory_per_session / 2 ** 20:.1f} MB "
+                        f"exceeds budget {args.memory_budget_mb} MB")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
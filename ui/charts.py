@@ -0,0 +1,49 @@
+import base64
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Chart helpers that keep large series compact on the wire: numeric columns are
+# sent as base64-encoded typed arrays instead of JSON lists, timestamps as epoch
+# milliseconds on a date axis instead of ISO strings, and long series switch to
+# WebGL (scattergl) traces so the browser doesn't draw thousands of SVG points.
+
+# Traces with at least this many points are drawn with WebGL
+WEBGL_THRESHOLD = 5000
+
+
+# Function to encode numbers as a plotly.js typed array spec (little-endian float64)
+def typed_array(values) -> dict:
+    array = np.ascontiguousarray(values, dtype="<f8")
+    return {"dtype": "f8", "bdata": base64.b64encode(array.tobytes()).decode("ascii")}
+
+
+# Function to convert timestamps to epoch milliseconds, which date axes accept as-is
+def epoch_ms(timestamps: pd.Series) -> np.ndarray:
+    timestamps = pd.to_datetime(timestamps)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert(None)
+    return timestamps.to_numpy(dtype="datetime64[ms]").astype("int64").astype("float64")
+
+
+# Drop-in for px.line(df, x=<timestamp column>, y=<numeric column>, labels=..., title=...).
+# plotly.js doesn't draw WebGL traces in the range slider preview, so charts with
+# a range slider stay on SVG and rely on the typed-array payload alone.
+def line_chart(df: pd.DataFrame, x: str, y: str, labels: dict = None, title: str = None,
+               rangeslider: bool = False, webgl_threshold: int = WEBGL_THRESHOLD) -> go.Figure:
+    labels = labels or {}
+    x_label = labels.get(x, x)
+    y_label = labels.get(y, y)
+
+    use_webgl = not rangeslider and len(df) >= webgl_threshold
+    trace_type = go.Scattergl if use_webgl else go.Scatter
+    fig = go.Figure(trace_type(
+        x=typed_array(epoch_ms(df[x])),
+        y=typed_array(df[y]),
+        mode="lines",
+        hovertemplate=f"{x_label}=%{{x}}<br>{y_label}=%{{y}}<extra></extra>",
+    ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label)
+    fig.update_xaxes(type="date", rangeslider_visible=rangeslider)
+    return fig
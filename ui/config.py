@@ -6,6 +6,7 @@ from typing import List
 import re
 import pytz
 from datetime import datetime
+import shared_cache
 
 # color settings:
 green = "#22c55e"
@@ -47,6 +48,8 @@ def clear_cache_if_needed(given_date_str: str):
         # Clear cache in Streamlit
         st.success(f"Data refreshed for {given_date_str}")
         st.cache_data.clear()
+        # Invalidate the shared cache for every process on this node too
+        shared_cache.bump_generation()
 
 
 # Function to convert string to array of floats
@@ -0,0 +1,171 @@
+import os
+import json
+import hashlib
+import argparse
+import tempfile
+from datetime import datetime, timezone
+
+import shared_cache
+
+# Precomputed dashboard export. Pages 2, 4 and 5 only change when a training
+# run finishes, so their figures are rendered once into a bundle directory and
+# the pages serve from it when present instead of reading Mongo on every visit.
+# A bundle goes stale once the shared cache generation moves on (see
+# config.clear_cache_if_needed) or it is older than BUNDLE_MAX_AGE; pages then
+# fall back to live reads until the export is run again. Pages check available()
+# once per run and skip connecting to Mongo entirely while it is true.
+#
+# Usage (from the repository root):
+#     python ui/dashboard_bundle.py [--mongo-uri URI] [--force]
+
+# bundle settings:
+BUNDLE_DIR = os.environ.get("MSBD_DASHBOARD_BUNDLE", "./dashboard_bundle")
+BUNDLE_MAX_AGE = int(os.environ.get("MSBD_DASHBOARD_BUNDLE_MAX_AGE", 60 * 60 * 24))
+MANIFEST_FILE = "manifest.json"
+FEATURES_FILE = "features.json"
+
+DB_NAME = "bitcoinprice"
+SOURCE_COLLECTIONS = ["Dataset_Raw", "all", "accuracy", "final"]
+
+# Features paths
+FEATURES_DIR = "./features"
+FEATURE_SETS = {
+    "Base Features": FEATURES_DIR + "/base_features.json",
+    "Base and Most Correlated Features": FEATURES_DIR + "/base_and_most_corr_features.json",
+    "Base and Least Correlated Features": FEATURES_DIR + "/base_and_least_corr_features.json",
+}
+
+
+def _path(name: str) -> str:
+    return os.path.join(BUNDLE_DIR, name)
+
+
+# Function to check whether a fresh bundle has been exported
+def available() -> bool:
+    try:
+        manifest = load_manifest()
+    except (FileNotFoundError, ValueError):
+        return False
+    if manifest.get("generation") != shared_cache.current_generation():
+        return False
+    generated_at = datetime.fromisoformat(manifest["generated_at"])
+    return (datetime.now(timezone.utc) - generated_at).total_seconds() < BUNDLE_MAX_AGE
+
+
+def load_manifest() -> dict:
+    with open(_path(MANIFEST_FILE)) as manifest_file:
+        return json.load(manifest_file)
+
+
+# Function to load the exported figures among names as plain dicts, ready for st.plotly_chart
+def load_figures(names: list) -> dict:
+    figure_files = load_manifest()["figures"]
+    figures = {}
+    for name in names:
+        if name in figure_files:
+            with open(_path(figure_files[name])) as json_file:
+                figures[name] = json.load(json_file)
+    return figures
+
+
+def load_features() -> dict:
+    with open(_path(FEATURES_FILE)) as features_file:
+        return json.load(features_file)
+
+
+# Write to a temporary file first so pages never read a half-written bundle file
+def _atomic_write(name: str, text: str):
+    fd, tmp_path = tempfile.mkstemp(dir=BUNDLE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(text)
+        os.replace(tmp_path, _path(name))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Fingerprint of everything the bundle is rendered from
+def source_hash(collections: dict, features: dict) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(collections):
+        digest.update(name.encode("utf-8"))
+        digest.update(json.dumps(collections[name], sort_keys=True, default=str).encode("utf-8"))
+    digest.update(json.dumps(features, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Function to write figures, features and the manifest; the manifest goes last
+def write(figures: dict, features: dict, data_hash: str):
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    figure_files = {}
+    for name, fig in figures.items():
+        figure_files[name] = f"{name}.json"
+        _atomic_write(f"{name}.json", fig.to_json())
+        _atomic_write(f"{name}.html", fig.to_html(full_html=False, include_plotlyjs="cdn"))
+    _atomic_write(FEATURES_FILE, json.dumps(features, separators=(",", ":")))
+    write_manifest(figure_files, data_hash)
+
+
+# Stamp the bundle with the current time and shared cache generation
+def write_manifest(figure_files: dict, data_hash: str):
+    _atomic_write(MANIFEST_FILE, json.dumps({
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generation": shared_cache.current_generation(),
+        "source_hash": data_hash,
+        "figures": figure_files,
+    }, indent=2))
+
+
+def load_feature_sets() -> dict:
+    features = {}
+    for title, path in FEATURE_SETS.items():
+        with open(os.path.abspath(path), "r") as file:
+            features[title] = json.load(file)
+    return features
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Export the precomputed dashboard bundle.")
+    parser.add_argument("--mongo-uri", help="defaults to mongo.connection_string in .streamlit/secrets.toml")
+    parser.add_argument("--force", action="store_true", help="re-render even if the data is unchanged")
+    return parser.parse_args()
+
+
+# Function to render the bundle from a Mongo database; returns what was done
+def export(db, force: bool = False) -> str:
+    import training_figures
+    import testing_figures
+
+    collections = {name: list(db[name].find({})) for name in SOURCE_COLLECTIONS}
+    features = load_feature_sets()
+
+    data_hash = source_hash(collections, features)
+    manifest = load_manifest() if os.path.exists(_path(MANIFEST_FILE)) else {}
+    if not force and manifest.get("source_hash") == data_hash:
+        # Same data, same figures: only re-stamp the manifest so pages trust it again
+        write_manifest(manifest["figures"], data_hash)
+        return f"Data unchanged, refreshed bundle in {BUNDLE_DIR}"
+
+    figures = {}
+    figures.update(training_figures.build_figures(collections["all"], collections["accuracy"]))
+    figures.update(testing_figures.build_figures(collections["final"]))
+    write(figures, features, data_hash)
+    return f"Exported {len(figures)} figures to {BUNDLE_DIR}"
+
+
+def main():
+    import pymongo
+
+    args = parse_args()
+    if args.mongo_uri:
+        connection_string = args.mongo_uri
+    else:
+        import streamlit as st
+        connection_string = st.secrets["mongo"]["connection_string"]
+
+    print(export(pymongo.MongoClient(connection_string)[DB_NAME], force=args.force))
+
+
+if __name__ == "__main__":
+    main()
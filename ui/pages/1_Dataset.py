@@ -1,7 +1,8 @@
 import streamlit as st
 import pandas as pd
 import pymongo
-import plotly.express as px
+import shared_cache
+import charts
 
 # MongoDB connection setup
 def init_connection():
@@ -21,14 +22,11 @@ client = init_connection()
 
 # Fetch data from MongoDB
 
-@st.cache_data
-def fetch_data():
+@st.cache_data(ttl=shared_cache.CACHE_TTL, max_entries=1)
+def fetch_data(generation):
     db_name = "bitcoinprice"  # Adjust as necessary
     collection_name = "Dataset_Raw"  # The collection name you specified
-    db = client[db_name]
-    collection = db[collection_name]
-    data = list(collection.find({}))
-    return pd.DataFrame(data)
+    return shared_cache.cached_collection(client, db_name, collection_name)
 
 
 # Helper function to format numbers as K, M, B, etc.
@@ -46,7 +44,7 @@ st.set_page_config(layout="wide", page_title="Bitcoin Data Dashboard", page_icon
 
 
 # Load data
-df = fetch_data()
+df = fetch_data(shared_cache.current_generation())
 if not df.empty:
     df['timestamp'] = pd.to_datetime(df['timestamp'])
     df['market-price'] = df['market-price'].astype(float)
@@ -93,8 +91,7 @@ col_chart, col_data = st.columns([3, 1])  # Proportion of 3:1 for chart to data
 with col_chart:
     st.header("Monthly Bitcoin Market Price Chart")
     # Creating an interactive line chart for market-price using Plotly
-    fig = px.line(filtered_df, x='timestamp', y='market-price', labels={'timestamp': 'Timestamp', 'market-price': 'Market Price'}, title='Market Price of Bitcoin Over Time')
-    fig.update_xaxes(rangeslider_visible=True)
+    fig = charts.line_chart(filtered_df, x='timestamp', y='market-price', labels={'timestamp': 'Timestamp', 'market-price': 'Market Price'}, title='Market Price of Bitcoin Over Time', rangeslider=True)
     st.plotly_chart(fig, use_container_width=True)
 
 with col_data:
@@ -112,8 +109,7 @@ with col_data:
 # with col_chart:
 st.header("Yearly Bitcoin Market Price Chart")
 # Creating an interactive line chart for market-price using Plotly
-fig = px.line(df, x='timestamp', y='market-price', labels={'timestamp': 'Timestamp', 'market-price': 'Market Price'}, title='Market Price of Bitcoin Over Time')
-fig.update_xaxes(rangeslider_visible=True)
+fig = charts.line_chart(df, x='timestamp', y='market-price', labels={'timestamp': 'Timestamp', 'market-price': 'Market Price'}, title='Market Price of Bitcoin Over Time', rangeslider=True)
 st.plotly_chart(fig, use_container_width=True)
 
 # with col_data:
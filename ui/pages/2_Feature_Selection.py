@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import pymongo
+import shared_cache
+import dashboard_bundle
 import json
 import os
 
@@ -18,27 +20,17 @@ def init_connection():
         st.error(f"Failed to connect to MongoDB: {e}")
         raise ConnectionError("Failed to connect to MongoDB")
 
-client = init_connection()
+use_bundle = dashboard_bundle.available()
+client = None if use_bundle else init_connection()
 
 # Fetch data from MongoDB
-@st.cache_data
-def fetch_data():
+@st.cache_data(ttl=shared_cache.CACHE_TTL, max_entries=1)
+def fetch_data(generation):
     db_name = "bitcoinprice"  # Adjust as necessary
     collection_name = "Dataset_Raw"  # The collection name you specified
-    db = client[db_name]
-    collection = db[collection_name]
-    data = list(collection.find({}))
-    return pd.DataFrame(data)
-
-# Set directories
-
-FEATURES_DIR = "./features"
-
-# Features paths
-BASE_FEATURES = FEATURES_DIR + "/base_features.json"
-BASE_AND_MOST_CORR_FEATURES = FEATURES_DIR + "/base_and_most_corr_features.json"
-BASE_AND_LEAST_CORR_FEATURES = FEATURES_DIR + "/base_and_least_corr_features.json"
+    return shared_cache.cached_collection(client, db_name, collection_name)
 
+# Feature set titles and paths are shared with the dashboard export
 def load_features(path):
     full_path = os.path.abspath(path)
     if os.path.exists(full_path):
@@ -78,16 +70,18 @@ st.markdown(
     """, unsafe_allow_html=True
 )
 
-# Load data
-df = fetch_data()
-if not df.empty:
-    df['timestamp'] = pd.to_datetime(df['timestamp'])
-    df['market-price'] = df['market-price'].astype(float)
-
 st.title("Feature Selection")
-st.subheader("Base Features")
-st.write(load_features(BASE_FEATURES))
-st.subheader("Base and Most Correlated Features")
-st.write(load_features(BASE_AND_MOST_CORR_FEATURES))
-st.subheader("Base and Least Correlated Features")
-st.write(load_features(BASE_AND_LEAST_CORR_FEATURES))
+if use_bundle:
+    for title, features in dashboard_bundle.load_features().items():
+        st.subheader(title)
+        st.write(features)
+else:
+    # Load data
+    df = fetch_data(shared_cache.current_generation())
+    if not df.empty:
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df['market-price'] = df['market-price'].astype(float)
+
+    for title, path in dashboard_bundle.FEATURE_SETS.items():
+        st.subheader(title)
+        st.write(load_features(path))
@@ -0,0 +1,208 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; see cached_frame
+    fcntl = None
+
+# Node-local cache shared by every Streamlit process on the same host.
+# Frames are stored as Arrow IPC files and read back through a memory map,
+# so replicas don't each keep their own fetch of the same Mongo collection.
+# Pages wrap their fetch in st.cache_data keyed on current_generation(), so each
+# process keeps one in-memory copy until bump_generation() moves every process on.
+# The shared layer needs POSIX file locking; elsewhere it is skipped and only the
+# per-process st.cache_data layer remains.
+
+# cache settings:
+CACHE_DIR = os.environ.get(
+    "MSBD_CACHE_DIR", os.path.join(tempfile.gettempdir(), "msbd5003_cache")
+)
+CACHE_MAX_BYTES = int(os.environ.get("MSBD_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+CACHE_TTL = int(os.environ.get("MSBD_CACHE_TTL", 60 * 60 * 24))
+
+GENERATION_FILE = "generation"
+# Schema metadata key listing object columns stored as JSON text
+JSON_COLUMNS_KEY = b"msbd_json_columns"
+ENTRY_SUFFIX = ".arrow"
+
+
+def _path(name: str) -> str:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+
+# Exclusive advisory lock on a lock file, held for the duration of the block
+@contextmanager
+def _locked(name: str) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    with open(_path(name + ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# Write to a temporary file first so readers never see a partial file
+def _atomic_write(path: str, data: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+# Function to read the generation counter shared by all processes
+def current_generation() -> int:
+    try:
+        with open(_path(GENERATION_FILE)) as generation_file:
+            return int(generation_file.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+# Function to invalidate every cached entry for every process on this node
+def bump_generation() -> int:
+    with _locked(GENERATION_FILE):
+        generation = current_generation() + 1
+        _atomic_write(_path(GENERATION_FILE), str(generation).encode("utf-8"))
+    evict()
+    return generation
+
+
+def _key_digest(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _is_fresh(path: str) -> bool:
+    try:
+        return time.time() - os.stat(path).st_mtime < CACHE_TTL
+    except FileNotFoundError:
+        return False
+
+
+def _read_entry(path: str) -> pd.DataFrame:
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+        df = table.to_pandas()
+    for column in json.loads((table.schema.metadata or {}).get(JSON_COLUMNS_KEY, b"[]")):
+        df[column] = df[column].map(json.loads)
+    # atime tracks last use for LRU eviction, mtime keeps the fetch time for the TTL
+    stat = os.stat(path)
+    os.utime(path, (time.time(), stat.st_mtime))
+    return df
+
+
+# Mongo doesn't enforce a schema, so a column may mix types that have no Arrow
+# equivalent; such columns are stored as JSON text and decoded again on read
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    json_columns = []
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            json_columns.append(column)
+    if json_columns:
+        df = df.assign(**{column: df[column].map(lambda value: json.dumps(value, default=str))
+                          for column in json_columns})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    return table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        JSON_COLUMNS_KEY: json.dumps(json_columns).encode("utf-8"),
+    })
+
+
+def _write_entry(path: str, df: pd.DataFrame):
+    table = _to_table(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    _atomic_write(path, sink.getvalue().to_pybytes())
+
+
+# Function to return a cached frame, calling loader in at most one process per node
+def cached_frame(key: str, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+    if fcntl is None:
+        return loader()
+    digest = _key_digest(key)
+    path = _path(f"{current_generation()}-{digest}{ENTRY_SUFFIX}")
+    if _is_fresh(path):
+        try:
+            return _read_entry(path)
+        except FileNotFoundError:
+            pass  # evicted between the check and the read
+
+    # The lock is per key, not per generation, so it outlives any single entry
+    with _locked(digest):
+        # Another process may have filled the entry while we waited for the lock
+        if _is_fresh(path):
+            return _read_entry(path)
+        _write_entry(path, loader())
+        df = _read_entry(path)
+    evict()
+    return df
+
+
+# Function to drop stale generations and least recently used entries over the size budget
+def evict(max_bytes: Optional[int] = None):
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    generation_prefix = f"{current_generation()}-"
+
+    with _locked("evict"):
+        entries = []
+        for name in os.listdir(CACHE_DIR):
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(CACHE_DIR, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if not name.startswith(generation_prefix):
+                _remove(path)
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+# Removing a file another process has mapped is safe, its mapping stays valid
+def _remove(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# Function to fetch a whole Mongo collection through the shared cache
+def cached_collection(client, db_name: str, collection_name: str) -> pd.DataFrame:
+    def load() -> pd.DataFrame:
+        data = list(client[db_name][collection_name].find({}))
+        df = pd.DataFrame(data)
+        # ObjectId has no Arrow type; the pages never use it beyond display
+        if "_id" in df.columns:
+            df["_id"] = df["_id"].astype(str)
+        return df
+
+    return cached_frame(f"{db_name}/{collection_name}", load)